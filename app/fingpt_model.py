@@ -11,10 +11,31 @@ API keys are read from:
 No keys are hard-coded in this file.
 """
 
-from typing import Literal, Optional
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import json
+import math
 import os
+import threading
+import time
 
-from openai import OpenAI, APIConnectionError  # type: ignore
+import httpx  # type: ignore
+from openai import AsyncOpenAI, OpenAI, APIConnectionError  # type: ignore
 import google.generativeai as genai  # type: ignore
 
 try:
@@ -26,17 +47,48 @@ except Exception:  # running outside Streamlit
 BackendType = Literal["openai", "gemini"]
 
 
+class Usage(NamedTuple):
+    prompt_tokens: int
+    completion_tokens: int
+
+
+_SYSTEM_PROMPT = (
+    "You are FinGPT, a trading assistant. "
+    "You analyse OHLCV price action and technical indicators. "
+    "Always include:\n"
+    "- Overall trend and momentum\n"
+    "- Key support and resistance zones\n"
+    "- Important risks to watch\n"
+    "This is strictly educational, NOT financial advice."
+)
+
+# Sampling temperature for every backend and request path
+_TEMPERATURE = 0.7
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _cache_resource(func: _F) -> _F:
+    """st.cache_resource inside Streamlit, a plain memo outside of it."""
+    if st is not None:
+        return st.cache_resource(show_spinner=False)(func)
+    return functools.lru_cache(maxsize=None)(func)  # type: ignore[return-value]
+
+
+@functools.lru_cache(maxsize=4)
 def _get_secret(name: str) -> str:
-    """Try Streamlit secrets, then environment variables."""
+    """Try Streamlit secrets, then environment variables. Resolved once per name."""
     val: Optional[str] = None
 
-    # 1) Streamlit secrets
-    if st is not None:
+    # 1) Streamlit secrets (a single .get instead of `in` + lookup)
+    secrets = getattr(st, "secrets", None)
+    if secrets is not None:
         try:
-            if name in st.secrets:
-                val = str(st.secrets[name])
-        except Exception:
-            pass
+            found = secrets.get(name)
+        except Exception:  # no secrets.toml at all
+            found = None
+        if found:
+            val = str(found)
 
     # 2) Environment variable
     if not val:
@@ -51,6 +103,144 @@ def _get_secret(name: str) -> str:
     return val
 
 
+# Connection pool shared by all OpenAI calls (sync and async)
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=16,
+    max_connections=32,
+    keepalive_expiry=60,
+)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+# Bounded retries/timeouts so a stalled upstream cannot hang the app for minutes
+_MAX_RETRIES = 2
+_GEMINI_TIMEOUT_SECONDS = 60.0
+_WARM_UP_TIMEOUT_SECONDS = 5.0
+
+# Batch statuses that may still change; everything else is terminal
+_BATCH_PENDING_STATUSES = frozenset({"validating", "in_progress", "finalizing", "cancelling"})
+
+# Upper bound on in-flight requests for analyse_many / analyse_many_async
+_MAX_CONCURRENCY = 8
+
+
+@_cache_resource
+def _openai_client() -> OpenAI:
+    """
+    One OpenAI client per process, so keep-alive connections (and their
+    TLS sessions) are reused across reruns instead of rebuilt per click.
+    """
+    http_client = httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    return OpenAI(
+        api_key=_get_secret("OPENAI_API_KEY"),
+        http_client=http_client,
+        timeout=_HTTP_TIMEOUT,
+        max_retries=_MAX_RETRIES,
+    )
+
+
+@_cache_resource
+def _configure_gemini() -> None:
+    genai.configure(api_key=_get_secret("GEMINI_API_KEY"))
+
+
+@_cache_resource
+def _gemini_client(model: str) -> Any:
+    _configure_gemini()
+    # IMPORTANT: use bare model id, not "models/..."
+    return genai.GenerativeModel(model, system_instruction=_SYSTEM_PROMPT)
+
+
+# ----- Response cache -----
+# Identical (backend, model, snapshot, question, max tokens) requests are
+# answered from memory for an hour instead of re-sending the paid prompt.
+_RESPONSE_TTL_SECONDS = 3600
+_RESPONSE_CACHE_SIZE = 128
+
+_response_cache: "OrderedDict[Hashable, Tuple[float, str]]" = OrderedDict()
+_response_lock = threading.Lock()
+
+
+def _cached_response(key: Hashable) -> Optional[str]:
+    with _response_lock:
+        hit = _response_cache.get(key)
+        if hit is None:
+            return None
+
+        stored_at, text = hit
+        if time.monotonic() - stored_at > _RESPONSE_TTL_SECONDS:
+            del _response_cache[key]
+            return None
+
+        _response_cache.move_to_end(key)
+        return text
+
+
+def _store_response(key: Hashable, text: str) -> None:
+    with _response_lock:
+        _response_cache[key] = (time.monotonic(), text)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+# When each (backend, model) was last warmed. A warmed socket stays in the pool
+# for at most keepalive_expiry, so re-warming sooner than that is wasted work.
+_last_warm: Dict[Tuple[str, str], float] = {}
+_warm_lock = threading.Lock()
+
+
+def _warm_up_request(backend: BackendType, model: str) -> Callable[[], Any]:
+    """A cheap call on the same cached client that analysis uses."""
+    if backend == "openai":
+        # with_options() shares the underlying connection pool
+        client = _openai_client().with_options(
+            timeout=_WARM_UP_TIMEOUT_SECONDS, max_retries=0
+        )
+        return client.models.list
+    # count_tokens goes through the same service client as generate_content
+    return functools.partial(
+        _gemini_client(model).count_tokens,
+        "ping",
+        request_options={"timeout": _WARM_UP_TIMEOUT_SECONDS},
+    )
+
+
+def _forget_warm(key: Tuple[str, str], warmed_at: float) -> None:
+    with _warm_lock:
+        if _last_warm.get(key) == warmed_at:
+            del _last_warm[key]
+
+
+def warm_up(backend: BackendType, model: str) -> None:
+    """
+    Open the HTTPS connection to the chosen backend ahead of an analysis,
+    in a background daemon thread so the caller never waits on TCP/TLS setup.
+    Skipped if the same backend was warmed within keepalive_expiry. Best
+    effort: never raises, and a failed warm-up is retried on the next call.
+    """
+    key = (backend, model)
+    now = time.monotonic()
+    with _warm_lock:
+        if now - _last_warm.get(key, -math.inf) < _HTTP_LIMITS.keepalive_expiry:
+            return
+        _last_warm[key] = now
+
+    try:
+        # Resolve the cached client (and secrets) on the calling script thread;
+        # only the network round trip moves to the background.
+        request = _warm_up_request(backend, model)
+    except Exception:
+        _forget_warm(key, now)
+        return
+
+    def run() -> None:
+        try:
+            request()
+        except Exception:
+            _forget_warm(key, now)
+
+    threading.Thread(target=run, name="fingpt-warm-up", daemon=True).start()
+
+
 class FinGPT:
     def __init__(
         self,
@@ -61,16 +251,15 @@ class FinGPT:
         self.backend: BackendType = backend
         self.openai_model = openai_model
         self.gemini_model = gemini_model
+        # Token usage reported with the last streamed response (None on a cache hit)
+        self.last_usage: Optional[Usage] = None
 
+        # Clients are cached per process; construction is just a lookup.
         if backend == "openai":
-            openai_key = _get_secret("OPENAI_API_KEY")
-            self._client = OpenAI(api_key=openai_key)
+            self._client = _openai_client()
             self._gemini_model = None
         else:
-            gemini_key = _get_secret("GEMINI_API_KEY")
-            genai.configure(api_key=gemini_key)
-            # IMPORTANT: use bare model id, not "models/..."
-            self._gemini_model = genai.GenerativeModel(self.gemini_model)
+            self._gemini_model = _gemini_client(self.gemini_model)
             self._client = None
 
     def analyse(
@@ -80,98 +269,370 @@ class FinGPT:
         max_new_tokens: int = 800,
     ) -> str:
         """Run LLM analysis for the given market snapshot + user question."""
+        key = self._cache_key(market_snapshot, user_question, max_new_tokens)
+        cached = _cached_response(key)
+        if cached is not None:
+            return cached
+
         if self.backend == "openai":
-            return self._analyse_openai(market_snapshot, user_question, max_new_tokens)
+            text = self._analyse_openai(market_snapshot, user_question, max_new_tokens)[0]
         else:
-            return self._analyse_gemini(market_snapshot, user_question, max_new_tokens)
+            text = self._analyse_gemini(market_snapshot, user_question, max_new_tokens)[0]
 
-    # ----- OpenAI -----
-    def _analyse_openai(
+        _store_response(key, text)
+        return text
+
+    def analyse_stream(
         self,
         market_snapshot: str,
         user_question: str,
-        max_new_tokens: int,
+        max_new_tokens: int = 800,
+    ) -> Iterator[str]:
+        """Same as analyse(), but yields text chunks as the model produces them."""
+        self.last_usage = None
+        key = self._cache_key(market_snapshot, user_question, max_new_tokens)
+        cached = _cached_response(key)
+        if cached is not None:
+            yield cached
+            return
+
+        if self.backend == "openai":
+            stream = self._stream_openai(market_snapshot, user_question, max_new_tokens)
+        else:
+            stream = self._stream_gemini(market_snapshot, user_question, max_new_tokens)
+
+        chunks: List[str] = []
+        for chunk in stream:
+            chunks.append(chunk)
+            yield chunk
+
+        # Only complete responses are cached
+        _store_response(key, "".join(chunks).strip())
+
+    def analyse_variants(
+        self,
+        market_snapshot: str,
+        user_question: str,
+        n: int = 3,
+        max_new_tokens: int = 800,
+    ) -> List[str]:
+        """
+        Return n independently sampled analyses from a single request.
+        The prompt is sent once, so only the extra output tokens are paid for.
+        Variants are meant to differ, so they bypass the response cache.
+        """
+        if self.backend == "openai":
+            return self._analyse_openai(market_snapshot, user_question, max_new_tokens, n=n)
+        else:
+            return self._analyse_gemini(market_snapshot, user_question, max_new_tokens, n=n)
+
+    def analyse_many(
+        self,
+        snaps: List[Tuple[str, str]],
+        max_new_tokens: int = 800,
+    ) -> List[str]:
+        """
+        Analyse several (market_snapshot, user_question) pairs concurrently.
+        Results are returned in input order; all workers share the pooled client.
+        """
+        if not snaps:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENCY, len(snaps))) as pool:
+            return list(
+                pool.map(
+                    lambda snap: self.analyse(snap[0], snap[1], max_new_tokens),
+                    snaps,
+                )
+            )
+
+    async def analyse_many_async(
+        self,
+        snaps: List[Tuple[str, str]],
+        max_new_tokens: int = 800,
+    ) -> List[str]:
+        """
+        asyncio variant of analyse_many(), with at most _MAX_CONCURRENCY
+        requests in flight. OpenAI uses AsyncOpenAI; Gemini calls run in threads.
+        """
+        sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+        if self.backend != "openai":
+            async def run_in_thread(snap: Tuple[str, str]) -> str:
+                async with sem:
+                    return await asyncio.to_thread(
+                        self.analyse, snap[0], snap[1], max_new_tokens
+                    )
+
+            return list(await asyncio.gather(*(run_in_thread(s) for s in snaps)))
+
+        # Async clients are bound to the running event loop, so one is built
+        # per call and shared by every request in the batch.
+        async with AsyncOpenAI(
+            api_key=_get_secret("OPENAI_API_KEY"),
+            http_client=httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
+            timeout=_HTTP_TIMEOUT,
+            max_retries=_MAX_RETRIES,
+        ) as client:
+
+            async def run(snap: Tuple[str, str]) -> str:
+                market_snapshot, user_question = snap
+                key = self._cache_key(market_snapshot, user_question, max_new_tokens)
+                cached = _cached_response(key)
+                if cached is not None:
+                    return cached
+
+                async with sem:
+                    try:
+                        resp = await client.chat.completions.create(
+                            **self._openai_request(
+                                self._openai_messages(market_snapshot, user_question),
+                                max_new_tokens,
+                            )
+                        )
+                    except Exception as e:
+                        raise self._openai_error(e)
+
+                text = (resp.choices[0].message.content or "").strip()
+                _store_response(key, text)
+                return text
+
+            return list(await asyncio.gather(*(run(s) for s in snaps)))
+
+    # ----- OpenAI Batch API (offline, 50% cheaper, 24h completion window) -----
+    def submit_batch(
+        self,
+        requests: List[Dict[str, str]],
+        max_new_tokens: int = 800,
     ) -> str:
-        if self._client is None:
-            raise RuntimeError("OpenAI client is not initialised.")
+        """
+        Submit many snapshot analyses as one OpenAI batch job.
 
-        system_message = (
-            "You are FinGPT, a trading assistant. "
-            "You analyse OHLCV price action and technical indicators. "
-            "Always include:\n"
-            "- Overall trend and momentum\n"
-            "- Key support and resistance zones\n"
-            "- Important risks to watch\n"
-            "This is strictly educational, NOT financial advice."
-        )
+        Each request is a dict with "market_snapshot" and "user_question"
+        (and optionally "custom_id", defaulting to its position in the list).
+        Returns the batch id to pass to retrieve_batch() later.
+        """
+        client = self._require_openai("The Batch API")
+
+        lines = []
+        for i, req in enumerate(requests):
+            body = self._openai_request(
+                self._openai_messages(req["market_snapshot"], req["user_question"]),
+                max_new_tokens,
+            )
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": str(req.get("custom_id", i)),
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": body,
+                    }
+                )
+            )
+
+        try:
+            batch_file = client.files.create(
+                file=("fingpt_batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+        except Exception as e:
+            raise self._openai_error(e)
+
+        return batch.id
+
+    def retrieve_batch(self, batch_id: str) -> Dict[str, str]:
+        """
+        Fetch the results of a finished batch as {custom_id: analysis text}.
+        Expired or cancelled batches return whatever requests did finish;
+        requests that failed inside the batch are left out. Raises if the
+        batch is still running or failed as a whole (e.g. invalid input file).
+        """
+        client = self._require_openai("The Batch API")
+
+        try:
+            batch = client.batches.retrieve(batch_id)
+            if batch.status in _BATCH_PENDING_STATUSES:
+                raise RuntimeError(
+                    f"Batch {batch_id} is not complete yet (status: {batch.status})."
+                )
+            if batch.status == "failed":
+                errors = getattr(batch.errors, "data", None) or []
+                details = "; ".join(e.message for e in errors if e.message)
+                raise RuntimeError(
+                    f"Batch {batch_id} failed"
+                    + (f": {details}" if details else ".")
+                )
+            # completed, or expired/cancelled with possibly partial output
+            if not batch.output_file_id:
+                return {}
+            content = client.files.content(batch.output_file_id).text
+        except RuntimeError:
+            raise
+        except Exception as e:
+            raise self._openai_error(e)
+
+        results: Dict[str, str] = {}
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                continue
+            msg = response["body"]["choices"][0]["message"].get("content") or ""
+            results[record["custom_id"]] = msg.strip()
+
+        return results
+
+    def _require_openai(self, feature: str) -> OpenAI:
+        if self.backend != "openai" or self._client is None:
+            raise RuntimeError(f"{feature} is only available with the OpenAI backend.")
+        return self._client
+
+    def _cache_key(
+        self,
+        market_snapshot: str,
+        user_question: str,
+        max_new_tokens: int,
+    ) -> Hashable:
+        model = self.openai_model if self.backend == "openai" else self.gemini_model
+        return (self.backend, model, market_snapshot, user_question, max_new_tokens)
 
+    # ----- OpenAI -----
+    @staticmethod
+    def _openai_messages(market_snapshot: str, user_question: str) -> List[dict]:
         user_content = (
             "Here is recent market and technical data for one instrument.\n\n"
             f"{market_snapshot}\n\n"
-            "User question:\n"
-            f"{user_question}"
+            f"User question:\n{user_question}"
         )
 
+        return [
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": user_content},
+        ]
+
+    def _openai_request(self, messages: List[dict], max_new_tokens: int) -> Dict[str, Any]:
+        """Chat-completions parameters shared by the sync, async and batch paths."""
+        return {
+            "model": self.openai_model,
+            "messages": messages,
+            "temperature": _TEMPERATURE,
+            "max_tokens": max_new_tokens,
+        }
+
+    def _openai_create(self, messages: List[dict], max_new_tokens: int, **kwargs: Any):
+        if self._client is None:
+            raise RuntimeError("OpenAI client is not initialised.")
+
         try:
-            resp = self._client.chat.completions.create(
-                model=self.openai_model,
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": user_content},
-                ],
-                temperature=0.7,
-                max_tokens=max_new_tokens,
+            return self._client.chat.completions.create(
+                **self._openai_request(messages, max_new_tokens),
+                **kwargs,
             )
-        except APIConnectionError:
-            raise RuntimeError(
+        except Exception as e:
+            raise self._openai_error(e)
+
+    @staticmethod
+    def _openai_error(e: Exception) -> RuntimeError:
+        if isinstance(e, APIConnectionError):
+            return RuntimeError(
                 "Connection error while contacting OpenAI. "
                 "Check your internet connection and that this machine can reach api.openai.com."
             )
-        except Exception as e:  # generic
-            raise RuntimeError(f"OpenAI request failed: {e}")
-
-        msg = resp.choices[0].message.content or ""
-        return msg.strip()
+        return RuntimeError(f"OpenAI request failed: {e}")
 
-    # ----- Gemini -----
-    def _analyse_gemini(
+    def _analyse_openai(
         self,
         market_snapshot: str,
         user_question: str,
         max_new_tokens: int,
-    ) -> str:
-        if self._gemini_model is None:
-            raise RuntimeError("Gemini model is not initialised.")
+        n: int = 1,
+    ) -> List[str]:
+        # With n > 1 the prompt is sent (and billed) once for all n completions
+        resp = self._openai_create(
+            self._openai_messages(market_snapshot, user_question),
+            max_new_tokens,
+            n=n,
+        )
+
+        return [(c.message.content or "").strip() for c in resp.choices]
 
-        system_message = (
-            "You are FinGPT, a trading assistant. "
-            "You analyse OHLCV price action and technical indicators. "
-            "Always include:\n"
-            "- Overall trend and momentum\n"
-            "- Key support and resistance zones\n"
-            "- Important risks to watch\n"
-            "This is strictly educational, NOT financial advice."
+    def _stream_openai(
+        self,
+        market_snapshot: str,
+        user_question: str,
+        max_new_tokens: int,
+    ) -> Iterator[str]:
+        resp = self._openai_create(
+            self._openai_messages(market_snapshot, user_question),
+            max_new_tokens,
+            stream=True,
+            # Token counts arrive in a final chunk with no choices
+            stream_options={"include_usage": True},
         )
 
-        prompt = (
-            system_message
-            + "\n\nHere is recent market and technical data for one instrument:\n"
-            + market_snapshot
-            + "\n\nUser question:\n"
-            + user_question
+        try:
+            for chunk in resp:
+                usage = getattr(chunk, "usage", None)
+                if usage is not None:
+                    self.last_usage = Usage(usage.prompt_tokens, usage.completion_tokens)
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+        except APIConnectionError:
+            raise RuntimeError(
+                "Connection to OpenAI was lost while streaming the response."
+            )
+
+    # ----- Gemini -----
+    @staticmethod
+    def _gemini_prompt(market_snapshot: str, user_question: str) -> str:
+        # The system prompt is set on the model itself (see _gemini_client)
+        return (
+            "Here is recent market and technical data for one instrument:\n"
+            f"{market_snapshot}\n\n"
+            f"User question:\n{user_question}"
         )
 
+    def _gemini_generate(
+        self,
+        prompt: str,
+        max_new_tokens: int,
+        candidate_count: int = 1,
+        **kwargs: Any,
+    ):
+        if self._gemini_model is None:
+            raise RuntimeError("Gemini model is not initialised.")
+
+        generation_config: Dict[str, Any] = {
+            "temperature": _TEMPERATURE,
+            "max_output_tokens": max_new_tokens,
+        }
+        if candidate_count > 1:
+            generation_config["candidate_count"] = candidate_count
+
         try:
-            resp = self._gemini_model.generate_content(
+            return self._gemini_model.generate_content(
                 prompt,
-                generation_config={
-                    "temperature": 0.7,
-                    "max_output_tokens": max_new_tokens,
-                },
+                generation_config=generation_config,
+                request_options={"timeout": _GEMINI_TIMEOUT_SECONDS},
+                **kwargs,
             )
         except Exception as e:  # network, invalid model id, etc.
             raise RuntimeError(f"Gemini request failed: {e}")
 
+    @staticmethod
+    def _gemini_text(resp: Any, index: int = 0) -> str:
+        """Extract text of one candidate from a Gemini response (or stream chunk)."""
         # Avoid using resp.text (which can throw if safety blocked)
         candidates = getattr(resp, "candidates", None)
         if not candidates:
@@ -180,7 +641,7 @@ class FinGPT:
                 "was blocked by safety filters."
             )
 
-        cand = candidates[0]
+        cand = candidates[index]
         finish_reason = getattr(cand, "finish_reason", None)
         # SAFETY blocks often show as finish_reason = 'SAFETY'
         if finish_reason and str(finish_reason).upper().endswith("SAFETY"):
@@ -196,9 +657,62 @@ class FinGPT:
             for p in parts.parts:
                 text_out += getattr(p, "text", "") or ""
 
-        if not text_out.strip():
+        return text_out
+
+    def _analyse_gemini(
+        self,
+        market_snapshot: str,
+        user_question: str,
+        max_new_tokens: int,
+        n: int = 1,
+    ) -> List[str]:
+        resp = self._gemini_generate(
+            self._gemini_prompt(market_snapshot, user_question),
+            max_new_tokens,
+            candidate_count=n,
+        )
+        # _gemini_text raises a clear error when there are no candidates at all
+        n_candidates = max(len(getattr(resp, "candidates", None) or []), 1)
+        texts = [self._gemini_text(resp, i).strip() for i in range(n_candidates)]
+
+        if not any(texts):
             raise RuntimeError(
                 "Gemini did not return any text. This may be due to safety filters."
             )
 
-        return text_out.strip()
+        return texts
+
+    def _stream_gemini(
+        self,
+        market_snapshot: str,
+        user_question: str,
+        max_new_tokens: int,
+    ) -> Iterator[str]:
+        resp = self._gemini_generate(
+            self._gemini_prompt(market_snapshot, user_question),
+            max_new_tokens,
+            stream=True,
+        )
+
+        got_text = False
+        try:
+            for chunk in resp:
+                # Each chunk carries running totals; the last one is final
+                usage = getattr(chunk, "usage_metadata", None)
+                if usage is not None:
+                    self.last_usage = Usage(
+                        usage.prompt_token_count, usage.candidates_token_count
+                    )
+                text = self._gemini_text(chunk)
+                if text:
+                    got_text = True
+                    yield text
+        except RuntimeError:
+            raise
+        except Exception as e:  # network errors surface while iterating
+            raise RuntimeError(f"Gemini request failed: {e}")
+
+        if not got_text:
+            raise RuntimeError(
+                "Gemini did not return any text. This may be due to safety filters."
+            )
@@ -5,7 +5,7 @@ import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
-from fingpt_model import FinGPT  # uses OpenAI + Gemini (no Grok)
+from fingpt_model import FinGPT, warm_up  # uses OpenAI + Gemini (no Grok)
 from market_data import fetch_ohlcv, latest_snapshot_text
 from technicals import (
     add_technical_indicators,
@@ -30,7 +30,7 @@ st.set_page_config(
 inject_global_css()
 
 
-def plot_candlestick(df: pd.DataFrame, ticker: str):
+def plot_candlestick(df: pd.DataFrame, ticker: str) -> go.Figure:
     fig = go.Figure(
         data=[
             go.Candlestick(
@@ -104,6 +104,10 @@ def main():
         st.session_state.df = None
     if "df_tech" not in st.session_state:
         st.session_state.df_tech = None
+    if "loaded_ticker" not in st.session_state:
+        st.session_state.loaded_ticker = None
+    if "fig" not in st.session_state:
+        st.session_state.fig = None
 
     col_data, col_chat = st.columns([2, 1])
 
@@ -118,8 +122,15 @@ def main():
 
                 st.session_state.df = df
                 st.session_state.df_tech = df_tech
+                st.session_state.loaded_ticker = ticker
+                # Built once per load; reruns reuse it instead of rebuilding
+                st.session_state.fig = plot_candlestick(df, ticker)
 
                 st.success(f"Loaded {len(df)} rows for {ticker}.")
+
+                # Analysis usually follows a data load: open the LLM connection
+                # in the background so the first analysis is a warm call
+                warm_up(backend, openai_model if backend == "openai" else gemini_model)
             except Exception as e:
                 # Clean error (no tracebacks, no file paths)
                 st.error(f"Error loading data: {e}")
@@ -128,16 +139,18 @@ def main():
             df = st.session_state.df
             df_tech = st.session_state.df_tech
 
-            st.plotly_chart(
-                plot_candlestick(df, ticker),
-                width="stretch",
-            )
+            st.plotly_chart(st.session_state.fig, width="stretch")
 
             with st.expander("Show raw data"):
-                st.dataframe(df.tail(50))
+                st.dataframe(df.tail(50), width="stretch", hide_index=True)
 
             with st.expander("Show technical indicators (latest rows)"):
-                st.dataframe(df_tech.tail(20))
+                # returns / macd_hist are derivable from close / macd and signal
+                st.dataframe(
+                    df_tech.tail(20).drop(columns=["returns", "macd_hist"]),
+                    width="stretch",
+                    hide_index=True,
+                )
 
     # ===== RIGHT: AI Analysis =====
     with col_chat:
@@ -164,7 +177,8 @@ def main():
                         combined = combine_market_and_technicals_text(
                             raw_snapshot=raw_snap,
                             tech_snapshot=tech_snap,
-                            ticker=ticker,
+                            # the instrument the data belongs to, not the sidebar input
+                            ticker=st.session_state.loaded_ticker,
                         )
 
                         fingpt = FinGPT(
@@ -173,13 +187,25 @@ def main():
                             gemini_model=gemini_model,
                         )
 
-                        analysis = fingpt.analyse(
+                        st.markdown("### 📊 Analysis Result")
+
+                        # Stream tokens into a placeholder as they arrive
+                        placeholder = st.empty()
+                        chunks = []
+                        for token in fingpt.analyse_stream(
                             market_snapshot=combined,
                             user_question=user_question,
-                        )
+                        ):
+                            chunks.append(token)
+                            placeholder.markdown("".join(chunks))
+
+                        usage = fingpt.last_usage
+                        if usage is not None:
+                            st.caption(
+                                f"Tokens: {usage.prompt_tokens} prompt + "
+                                f"{usage.completion_tokens} completion"
+                            )
 
-                        st.markdown("### 📊 Analysis Result")
-                        st.write(analysis)
                         st.balloons()
                     except Exception as e:
                         st.error(f"Error running analysis: {e}")
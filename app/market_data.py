@@ -5,24 +5,138 @@ Fetch OHLCV data from Yahoo Finance and normalise it.
 Output columns: date, open, high, low, close, volume
 """
 
-from typing import Literal
+from pathlib import Path
+from typing import Any, Callable, Literal, Optional, TypeVar
+import functools
+import os
+import re
+import time
 
 import pandas as pd
 import yfinance as yf
+from yfinance.exceptions import YFException
+
+try:
+    import streamlit as st  # type: ignore
+except Exception:  # running outside Streamlit
+    st = None  # type: ignore
+
+PeriodType = Literal["1mo", "3mo", "6mo", "1y", "2y"]
+IntervalType = Literal["1d", "1h", "30m", "15m"]
+
+# Cleaned downloads are kept on disk so they survive app restarts.
+_CACHE_DIR = Path.home() / ".fingpt_cache"
+
+# Retry policy for transient Yahoo Finance failures (network errors,
+# timeouts, outages); history()'s own 10 s default timeout bounds each attempt
+_YF_RETRIES = 2
+_YF_BACKOFF_SECONDS = 0.3
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _cache_data(func: _F) -> _F:
+    """st.cache_data inside Streamlit, a plain memo outside of it."""
+    if st is not None:
+        return st.cache_data(max_entries=32, show_spinner=False)(func)
+    return functools.lru_cache(maxsize=32)(func)  # type: ignore[return-value]
+
+
+def _ttl(interval: str) -> int:
+    """How long a download stays fresh: 24 h for daily candles, 1 h for intraday."""
+    return 86400 if interval == "1d" else 3600
 
 
 def fetch_ohlcv(
     ticker: str,
-    period: Literal["1mo", "3mo", "6mo", "1y", "2y"] = "6mo",
-    interval: Literal["1d", "1h", "30m", "15m"] = "1d",
+    period: PeriodType = "6mo",
+    interval: IntervalType = "1d",
 ) -> pd.DataFrame:
-    df = yf.download(
-        ticker,
-        period=period,
-        interval=interval,
-        auto_adjust=False,
-        progress=False,
-    )
+    """
+    Cached OHLCV download. The parquet file under ~/.fingpt_cache is the single
+    source of freshness: while it is younger than _ttl(interval) it is served
+    (from memory after the first read), otherwise Yahoo Finance is hit again.
+    """
+    path = _cache_path(ticker, period, interval)
+
+    mtime = _fresh_mtime(path, interval)
+    if mtime is not None:
+        try:
+            return _read_cached(str(path), mtime)
+        except Exception:
+            pass  # unreadable file: download again
+
+    out = _download_ohlcv(ticker, period, interval)
+    _write_cache(path, out)
+    return out
+
+
+def _cache_path(ticker: str, period: str, interval: str) -> Path:
+    safe_ticker = re.sub(r"[^A-Za-z0-9._-]", "_", ticker)
+    return _CACHE_DIR / f"{safe_ticker}_{period}_{interval}.parquet"
+
+
+def _fresh_mtime(path: Path, interval: str) -> Optional[float]:
+    """mtime of the cached file if it is still within its TTL, else None."""
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return None
+    return mtime if time.time() - mtime < _ttl(interval) else None
+
+
+@_cache_data
+def _read_cached(path: str, mtime: float) -> pd.DataFrame:
+    # mtime is part of the cache key only: a rewritten file gets a new entry,
+    # so the in-memory copy can never outlive the file's own TTL.
+    return pd.read_parquet(path)
+
+
+def _write_cache(path: Path, out: pd.DataFrame) -> None:
+    # The disk cache is best effort: failures just mean the next call downloads.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        out.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        pass
+
+
+def _download_ohlcv(
+    ticker: str,
+    period: PeriodType,
+    interval: IntervalType,
+) -> pd.DataFrame:
+    # yf.download swallows every error into an empty frame, so use
+    # Ticker.history(raise_errors=True) to tell failures apart: yfinance's own
+    # exceptions (unknown ticker, no prices for this period) are final, while
+    # anything else (network errors, timeouts, Yahoo outages) is retried.
+    last_error: Optional[Exception] = None
+    for attempt in range(_YF_RETRIES + 1):
+        if attempt:
+            time.sleep(_YF_BACKOFF_SECONDS * 2 ** (attempt - 1))
+        try:
+            df = yf.Ticker(ticker).history(
+                period=period,
+                interval=interval,
+                auto_adjust=False,
+                actions=False,
+                raise_errors=True,
+            )
+            break
+        except YFException as e:
+            raise ValueError(
+                f"No data returned for {ticker} ({e}). "
+                f"Try a longer period or a different interval."
+            ) from e
+        except Exception as e:
+            last_error = e
+    else:
+        raise ValueError(
+            f"Could not download data for {ticker} after {_YF_RETRIES + 1} attempts: "
+            f"{last_error}"
+        ) from last_error
 
     if df is None or df.empty:
         raise ValueError(
@@ -65,14 +179,20 @@ def fetch_ohlcv(
             f"Columns available: {available}"
         )
 
-    out = df[required].copy()
+    # Ensure numeric: yfinance already returns float prices and integer volume,
+    # so one cast of the price columns is usually a no-op; fall back to
+    # coercion for anything odd. Volume keeps its integer dtype when it has one.
+    prices = ["open", "high", "low", "close"]
+    try:
+        df = df.astype(dict.fromkeys(prices, "float64"))
+    except (TypeError, ValueError):
+        df[prices] = df[prices].apply(pd.to_numeric, errors="coerce")
+    df["volume"] = pd.to_numeric(df["volume"], errors="coerce")
 
-    # Ensure numeric
-    for col in ["open", "high", "low", "close", "volume"]:
-        out[col] = pd.to_numeric(out[col], errors="coerce")
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
 
-    out["date"] = pd.to_datetime(out["date"], errors="coerce")
-    out = out.dropna(subset=["date", "close"])
+    # Column selection already copies; dropna returns a fresh frame too
+    out = df[required].dropna(subset=["date", "close"])
 
     if out.empty:
         raise ValueError(
@@ -3,37 +3,137 @@
 Compute a few simple technical indicators and turn them into text.
 """
 
-from typing import Tuple
+import math
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit  # type: ignore
+except Exception:  # numba not installed: run the kernels as plain Python
+    def njit(*args, **kwargs):  # type: ignore
+        return lambda func: func
+
+
+# Column order of the array returned by _all_indicators
+_INDICATOR_COLUMNS = [
+    "sma_20",
+    "sma_50",
+    "ema_20",
+    "rsi_14",
+    "macd",
+    "macd_signal",
+    "macd_hist",
+    "returns",
+    "volatility_20",
+]
+_N_INDICATORS = len(_INDICATOR_COLUMNS)
+
+# (indicator that must be present, text template) for technical_snapshot_text
+_SNAPSHOT_FIELDS = (
+    ("sma_20", "SMA20={sma_20:.2f}"),
+    ("sma_50", "SMA50={sma_50:.2f}"),
+    ("ema_20", "EMA20={ema_20:.2f}"),
+    ("rsi_14", "RSI14={rsi_14:.1f}"),
+    ("macd", "MACD={macd:.4f}, Signal={macd_signal:.4f}, Hist={macd_hist:.4f}"),
+    ("volatility_20", "20-day volatility={volatility_20:.4f}"),
+)
+
+
+@njit(cache=True)
+def _all_indicators(close: np.ndarray) -> np.ndarray:
+    """
+    Compute every indicator in one sweep over `close`, keeping running state
+    for each instead of re-reading the array once per pandas rolling/ewm call.
+    Matches pandas semantics: rolling(min_periods=...), ewm(adjust=False),
+    pct_change() and rolling std with ddof=1.
+    """
+    n = close.shape[0]
+    out = np.full((n, _N_INDICATORS), np.nan)
+    if n == 0:
+        return out
+
+    rsi_period = 14
+    a_ema20 = 2.0 / (20 + 1)
+    a_fast = 2.0 / (12 + 1)
+    a_slow = 2.0 / (26 + 1)
+    a_signal = 2.0 / (9 + 1)
+
+    sum_20 = 0.0
+    sum_50 = 0.0
+    ema_20 = close[0]
+    ema_fast = close[0]
+    ema_slow = close[0]
+    signal = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    ret_sum = 0.0
+    ret_sumsq = 0.0
+
+    for i in range(n):
+        c = close[i]
+
+        # Simple moving averages (rolling sums over the raw array)
+        sum_20 += c
+        sum_50 += c
+        if i >= 20:
+            sum_20 -= close[i - 20]
+        if i >= 50:
+            sum_50 -= close[i - 50]
+        count_20 = min(i + 1, 20)
+        count_50 = min(i + 1, 50)
+        if count_20 >= 5:
+            out[i, 0] = sum_20 / count_20
+        if count_50 >= 10:
+            out[i, 1] = sum_50 / count_50
+
+        # Exponential moving averages and MACD
+        if i > 0:
+            ema_20 = a_ema20 * c + (1.0 - a_ema20) * ema_20
+            ema_fast = a_fast * c + (1.0 - a_fast) * ema_fast
+            ema_slow = a_slow * c + (1.0 - a_slow) * ema_slow
+        macd = ema_fast - ema_slow
+        if i == 0:
+            signal = macd
+        else:
+            signal = a_signal * macd + (1.0 - a_signal) * signal
+        out[i, 2] = ema_20
+        out[i, 4] = macd
+        out[i, 5] = signal
+        out[i, 6] = macd - signal
+
+        if i == 0:
+            continue
+
+        # Wilder RSI, seeded with a simple average of the first moves
+        delta = c - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i <= rsi_period:
+            avg_gain += gain / rsi_period
+            avg_loss += loss / rsi_period
+        else:
+            avg_gain = (avg_gain * (rsi_period - 1) + gain) / rsi_period
+            avg_loss = (avg_loss * (rsi_period - 1) + loss) / rsi_period
+        if i >= rsi_period:
+            rs = avg_gain / (avg_loss + 1e-9)
+            out[i, 3] = 100.0 - 100.0 / (1.0 + rs)
+
+        # Returns and 20-period volatility (returns start at index 1)
+        ret = c / close[i - 1] - 1.0
+        out[i, 7] = ret
+        ret_sum += ret
+        ret_sumsq += ret * ret
+        if i > 20:
+            old = out[i - 20, 7]
+            ret_sum -= old
+            ret_sumsq -= old * old
+        count_ret = min(i, 20)
+        if count_ret >= 5:
+            var = (ret_sumsq - ret_sum * ret_sum / count_ret) / (count_ret - 1)
+            out[i, 8] = np.sqrt(max(var, 0.0))
 
-def _rsi(series: pd.Series, period: int = 14) -> pd.Series:
-    delta = series.diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-
-    avg_gain = gain.rolling(window=period, min_periods=period).mean()
-    avg_loss = loss.rolling(window=period, min_periods=period).mean()
-
-    rs = avg_gain / (avg_loss + 1e-9)
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
-
-
-def _macd(
-    series: pd.Series,
-    fast: int = 12,
-    slow: int = 26,
-    signal: int = 9,
-) -> Tuple[pd.Series, pd.Series, pd.Series]:
-    ema_fast = series.ewm(span=fast, adjust=False).mean()
-    ema_slow = series.ewm(span=slow, adjust=False).mean()
-    macd = ema_fast - ema_slow
-    signal_line = macd.ewm(span=signal, adjust=False).mean()
-    hist = macd - signal_line
-    return macd, signal_line, hist
+    return out
 
 
 def add_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
@@ -43,25 +143,12 @@ def add_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
     """
     out = df.copy()
 
-    close = pd.Series(out["close"].to_numpy().reshape(-1), index=out.index)
-
-    # Moving averages
-    out["sma_20"] = close.rolling(window=20, min_periods=5).mean()
-    out["sma_50"] = close.rolling(window=50, min_periods=10).mean()
-    out["ema_20"] = close.ewm(span=20, adjust=False).mean()
-
-    # RSI
-    out["rsi_14"] = _rsi(close, period=14)
+    close = out["close"]
+    if close.ndim > 1:  # duplicate "close" columns come back as a DataFrame
+        close = close.iloc[:, 0]
 
-    # MACD
-    macd_line, signal_line, hist = _macd(close, fast=12, slow=26, signal=9)
-    out["macd"] = macd_line
-    out["macd_signal"] = signal_line
-    out["macd_hist"] = hist
-
-    # Simple volatility
-    out["returns"] = close.pct_change()
-    out["volatility_20"] = out["returns"].rolling(window=20, min_periods=5).std()
+    # SMA20/50, EMA20, RSI14, MACD(12, 26, 9), returns and 20-period volatility
+    out[_INDICATOR_COLUMNS] = _all_indicators(close.to_numpy(dtype=np.float64))
 
     return out
 
@@ -70,30 +157,12 @@ def technical_snapshot_text(df_tech: pd.DataFrame) -> str:
     """
     Turn the latest technical indicators into a concise text summary.
     """
-    row = df_tech.iloc[-1]
-    parts = []
-
-    if not np.isnan(row.get("sma_20", np.nan)):
-        parts.append(f"SMA20={row['sma_20']:.2f}")
-    if not np.isnan(row.get("sma_50", np.nan)):
-        parts.append(f"SMA50={row['sma_50']:.2f}")
-    if not np.isnan(row.get("ema_20", np.nan)):
-        parts.append(f"EMA20={row['ema_20']:.2f}")
-
-    if not np.isnan(row.get("rsi_14", np.nan)):
-        parts.append(f"RSI14={row['rsi_14']:.1f}")
-
-    if not np.isnan(row.get("macd", np.nan)):
-        parts.append(
-            f"MACD={row['macd']:.4f}, "
-            f"Signal={row['macd_signal']:.4f}, "
-            f"Hist={row['macd_hist']:.4f}"
-        )
-
-    if not np.isnan(row.get("volatility_20", np.nan)):
-        parts.append(f"20-day volatility={row['volatility_20']:.4f}")
-
-    return " | ".join(parts)
+    row = df_tech.iloc[-1].to_dict()
+    return " | ".join(
+        fmt.format_map(row)
+        for key, fmt in _SNAPSHOT_FIELDS
+        if not math.isnan(row.get(key, math.nan))
+    )
 
 
 def combine_market_and_technicals_text(